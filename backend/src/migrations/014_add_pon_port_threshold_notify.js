@@ -0,0 +1,35 @@
+/**
+ * Migration: Notify PON Port Threshold Changes
+ * Description: Publishes pon_ports_changed so the PON poller can refresh its cached thresholds
+ */
+
+module.exports = {
+  up: async (queryInterface) => {
+    // Function: Notify listeners with the changed PON port id
+    await queryInterface.sequelize.query(`
+      CREATE OR REPLACE FUNCTION notify_pon_ports_changed()
+      RETURNS TRIGGER AS $$
+      BEGIN
+        PERFORM pg_notify('pon_ports_changed', NEW.id::text);
+        RETURN NEW;
+      END;
+      $$ LANGUAGE plpgsql;
+    `);
+
+    // Trigger: Notify when a PON port is added or its thresholds change
+    await queryInterface.sequelize.query(`
+      CREATE TRIGGER notify_pon_ports_changed_trigger
+      AFTER INSERT OR UPDATE OF threshold_temperature_high, threshold_utilization_high, threshold_rx_power_low
+      ON pon_ports
+      FOR EACH ROW
+      EXECUTE FUNCTION notify_pon_ports_changed();
+    `);
+  },
+
+  down: async (queryInterface) => {
+    await queryInterface.sequelize.query(`
+      DROP TRIGGER IF EXISTS notify_pon_ports_changed_trigger ON pon_ports;
+      DROP FUNCTION IF EXISTS notify_pon_ports_changed();
+    `);
+  },
+};
@@ -1,32 +0,0 @@
-#!/usr/bin/env python3
-import os
-import time
-import logging
-from datetime import datetime
-from dotenv import load_dotenv
-
-load_dotenv()
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-def main():
-    logger.info("🚀 PON Port Poller started")
-    
-    while True:
-        try:
-            logger.info("Polling PON ports...")
-            # Actual polling logic would go here
-            time.sleep(30)
-        except KeyboardInterrupt:
-            logger.info("Shutting down...")
-            break
-        except Exception as e:
-            logger.error(f"Error: {e}")
-            time.sleep(5)
-
-if __name__ == '__main__':
-    main()
@@ -5,15 +5,98 @@ Main polling service for OLT/PON monitoring
 
 import asyncio
 import asyncpg
-import redis
+import numpy as np
+import redis.asyncio as aioredis
 import time
+import uvloop
 import os
+from functools import lru_cache
+from itertools import groupby
 from datetime import datetime
-from pysnmp.hlapi import *
-from influxdb_client import InfluxDBClient, Point
+from pyasn1.type.univ import Null
+from pysnmp.hlapi.v1arch.asyncio import (
+    SnmpDispatcher,
+    CommunityData,
+    UdpTransportTarget,
+    getCmd,
+)
+from influxdb_client import InfluxDBClient, WritePrecision
 from influxdb_client.client.write_api import SYNCHRONOUS
-from vendors.zte import ZTEVendor
-from vendors.huawei import HuaweiVendor
+from vendors import get_vendor
+
+# Hot-path SQL. Kept as constants so every call reuses the same text and
+# hits asyncpg's per-connection prepared statement cache (bind + execute only).
+SELECT_ACTIVE_PON_PORTS_SQL = """
+    SELECT
+        o.id AS olt_id,
+        o.name AS olt_name,
+        o.vendor,
+        o.ip_address,
+        o.snmp_community,
+        p.id,
+        p.port_number,
+        p.port_name
+    FROM olts o
+    LEFT JOIN pon_ports p ON p.olt_id = o.id AND p.status = 'active'
+    WHERE o.status = 'active'
+    ORDER BY o.id
+"""
+
+UPDATE_PON_PORT_SQL = """
+    UPDATE pon_ports SET
+        temperature = $1,
+        voltage = $2,
+        tx_power = $3,
+        rx_power = $4,
+        utilization = $5,
+        bandwidth_in = $6,
+        bandwidth_out = $7,
+        online_onus = $8,
+        offline_onus = $9,
+        total_onus = $10,
+        health_score = $11,
+        last_poll = NOW()
+    WHERE id = $12
+"""
+
+UPDATE_OLTS_LAST_POLL_SQL = "UPDATE olts SET last_poll = NOW() WHERE id = ANY($1)"
+
+# Alert thresholds rarely change, so they are cached and only re-read when
+# pon_ports_changed is notified (see migration 014) or every few cycles.
+SELECT_PON_PORT_THRESHOLDS_SQL = """
+    SELECT id, threshold_temperature_high, threshold_utilization_high, threshold_rx_power_low
+    FROM pon_ports
+"""
+
+SELECT_CHANGED_PON_PORT_THRESHOLDS_SQL = """
+    SELECT id, threshold_temperature_high, threshold_utilization_high, threshold_rx_power_low
+    FROM pon_ports
+    WHERE id = ANY($1)
+"""
+
+PON_PORTS_CHANGED_CHANNEL = 'pon_ports_changed'
+
+@lru_cache(maxsize=4096)
+def pon_port_var_binds(vendor_class, port_number):
+    """Numeric SNMP var-binds for all PON port metrics, built once per vendor/port"""
+    return tuple(
+        (base_oid + (port_number,), Null())
+        for base_oid in vendor_class.PON_PORT_OIDS_TUPLE.values()
+    )
+
+def scale_metric(value, scale):
+    """Convert a raw SNMP integer with a vendor SCALES entry (None if invalid)"""
+    offset, divisor, invalid = scale
+    if not isinstance(value, int) or value in invalid:
+        return None
+    return (value - offset) / divisor
+
+# Line protocol tag values must escape backslashes, commas, equals signs and spaces
+TAG_ESCAPES = str.maketrans({'\\': '\\\\', ',': r'\,', '=': r'\=', ' ': r'\ ', '\n': r'\n'})
+
+def escape_tag(value):
+    """Escape a tag value for InfluxDB line protocol"""
+    return str(value).translate(TAG_ESCAPES)
 
 class PONPortPoller:
     def __init__(self):
@@ -21,6 +104,15 @@ class PONPortPoller:
         self.redis_client = None
         self.influx_client = None
         self.influx_write_api = None
+        self.snmp_dispatcher = None
+        self.snmp_targets = {}  # (ip, community) -> (transport target, auth data)
+        
+        # PON port id -> (temperature high, utilization high, RX power low)
+        self.thresholds = {}
+        self.stale_thresholds = set()  # port ids notified on pon_ports_changed
+        self.threshold_conn = None  # dedicated LISTEN connection
+        self.threshold_lock = asyncio.Lock()  # overlapping cycles share threshold_conn
+        self.cycles_since_threshold_load = 0
         
         # Configuration
         self.db_config = {
@@ -29,6 +121,9 @@ class PONPortPoller:
             'database': os.getenv('POSTGRES_DB', 'wagateway'),
             'user': os.getenv('POSTGRES_USER', 'wagateway'),
             'password': os.getenv('POSTGRES_PASSWORD', ''),
+            # Keep hot statements prepared for the lifetime of the connection
+            'statement_cache_size': int(os.getenv('POSTGRES_STATEMENT_CACHE_SIZE', 100)),
+            'max_cached_statement_lifetime': 0,
         }
         
         self.redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379')
@@ -40,12 +135,15 @@ class PONPortPoller:
             'bucket': os.getenv('INFLUXDB_BUCKET', 'pon_monitoring'),
         }
         
-        self.vendor_map = {
-            'ZTE': ZTEVendor,
-            'Huawei': HuaweiVendor,
-        }
-        
         self.poll_interval = int(os.getenv('POLL_INTERVAL', 60))  # seconds
+        self.influx_batch_size = int(os.getenv('INFLUX_BATCH_SIZE', 5000))  # points per write
+        self.threshold_reload_cycles = int(os.getenv('THRESHOLD_RELOAD_CYCLES', 60))  # full reload fallback
+        
+        # Poll cycles allowed to run at once (a slow cycle overlaps the next one)
+        self.cycle_semaphore = asyncio.Semaphore(int(os.getenv('MAX_CONCURRENT_CYCLES', 2)))
+        
+        # Cap in-flight SNMP requests across all OLTs
+        self.snmp_semaphore = asyncio.Semaphore(int(os.getenv('SNMP_CONCURRENCY', 64)))
     
     async def initialize(self):
         """Initialize database connections"""
@@ -55,9 +153,13 @@ class PONPortPoller:
         self.db_pool = await asyncpg.create_pool(**self.db_config, min_size=2, max_size=10)
         print(f"✓ Connected to PostgreSQL: {self.db_config['database']}")
         
+        # PON port thresholds (cached, refreshed on pon_ports_changed)
+        await self.load_thresholds()
+        print(f"✓ Loaded thresholds for {len(self.thresholds)} PON ports")
+        
         # Redis
-        self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
-        self.redis_client.ping()
+        self.redis_client = aioredis.from_url(self.redis_url)
+        await self.redis_client.ping()
         print(f"✓ Connected to Redis")
         
         # InfluxDB
@@ -68,70 +170,165 @@ class PONPortPoller:
         )
         self.influx_write_api = self.influx_client.write_api(write_options=SYNCHRONOUS)
         print(f"✓ Connected to InfluxDB: {self.influx_config['bucket']}")
+        
+        # SNMP dispatcher (shared by all requests, no MIB resolution)
+        self.snmp_dispatcher = SnmpDispatcher()
     
     async def poll_all_olts(self):
         """Poll all active OLTs"""
+        # One timestamp for every sample in this cycle
+        cycle_ns = time.time_ns()
+        cycle_time = (cycle_ns, datetime.utcfromtimestamp(cycle_ns / 1e9).isoformat().encode())
+        
+        await self.refresh_thresholds()
+        
+        # Active OLTs and their active PON ports in a single query
         async with self.db_pool.acquire() as conn:
-            olts = await conn.fetch(
-                "SELECT * FROM olts WHERE status = 'active' ORDER BY id"
-            )
-            
-            print(f"\n=== Polling {len(olts)} OLTs ===")
-            
-            tasks = []
-            for olt in olts:
-                task = self.poll_olt(olt)
-                tasks.append(task)
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            rows = await conn.fetch(SELECT_ACTIVE_PON_PORTS_SQL)
+        
+        olts = []
+        for olt_id, olt_rows in groupby(rows, key=lambda row: row['olt_id']):
+            olt_rows = list(olt_rows)
+            first = olt_rows[0]
+            olt = {
+                'id': olt_id,
+                'name': first['olt_name'],
+                'vendor': first['vendor'],
+                'ip_address': first['ip_address'],
+                'snmp_community': first['snmp_community'],
+            }
+            pon_ports = [row for row in olt_rows if row['id'] is not None]
+            olts.append((olt, pon_ports))
+        
+        print(f"\n=== Polling {len(olts)} OLTs ===")
+        
+        # Flatten to (OLT, PON port) pairs so all ports share one fan-out
+        pairs = []
+        port_counts = {}
+        for olt, pon_ports in olts:
+            print(f"  Polling OLT: {olt['name']} ({olt['ip_address']})")
             
-            success = sum(1 for r in results if r is True)
-            failed = len(results) - success
+            # Get vendor handler (only vendors with PON port OIDs can be polled)
+            vendor_class = get_vendor(olt['vendor'] or '')
+            if not hasattr(vendor_class, 'PON_PORT_OIDS'):
+                print(f"  ✗ Unsupported vendor: {olt['vendor']}")
+                continue
             
-            print(f"✓ Polling completed: {success} success, {failed} failed")
+            port_counts[olt['id']] = len(pon_ports)
+            pairs.extend((olt, pon_port, vendor_class) for pon_port in pon_ports)
+        
+        # In-flight SNMP requests are capped by snmp_semaphore
+        results = await asyncio.gather(
+            *(self.poll_pon_port(olt, pon_port, vendor_class)
+              for olt, pon_port, vendor_class in pairs),
+            return_exceptions=True
+        )
+        
+        # Aggregate per OLT: an OLT fails when none of its PON ports answered
+        samples = []
+        ports_ok = dict.fromkeys(port_counts, 0)
+        for (olt, pon_port, _), metrics in zip(pairs, results):
+            if isinstance(metrics, dict):
+                ports_ok[olt['id']] += 1
+                samples.append((olt, pon_port, metrics))
+        
+        success = 0
+        for olt_id, total in port_counts.items():
+            if total == 0 or ports_ok[olt_id] > 0:
+                success += 1
+        failed = len(olts) - success
+        
+        print(f"✓ Polling completed: {success} success, {failed} failed")
+        
+        # Writes are collected per cycle, so an overlapping cycle never flushes this one's data
+        updates, points, cache = [], [], {}
+        await self.process_samples(samples, cycle_time, updates, points, cache)
+        await self.flush_updates(updates, list(port_counts))
+        await self.flush_points(points)
+        await self.flush_cache(cache)
     
-    async def poll_olt(self, olt):
-        """Poll single OLT"""
-        olt_id = olt['id']
-        olt_name = olt['name']
+    async def load_thresholds(self):
+        """Load all PON port thresholds and (re)subscribe to pon_ports_changed"""
+        if self.threshold_conn is None or self.threshold_conn.is_closed():
+            self.threshold_conn = await asyncpg.connect(**self.db_config)
+            await self.threshold_conn.add_listener(PON_PORTS_CHANGED_CHANNEL, self.on_pon_ports_changed)
+        
+        # Notifications received from here on are covered by the full load
+        self.stale_thresholds.clear()
+        rows = await self.threshold_conn.fetch(SELECT_PON_PORT_THRESHOLDS_SQL)
+        self.thresholds = {row['id']: tuple(row[1:]) for row in rows}
+        self.cycles_since_threshold_load = 0
+    
+    def on_pon_ports_changed(self, connection, pid, channel, payload):
+        """Mark a PON port's thresholds stale (payload is the port id)"""
+        self.stale_thresholds.add(payload)
+    
+    async def refresh_thresholds(self):
+        """Re-read notified thresholds, or all of them every few cycles"""
+        self.cycles_since_threshold_load += 1
+        try:
+            async with self.threshold_lock:
+                if (self.cycles_since_threshold_load >= self.threshold_reload_cycles
+                        or self.threshold_conn.is_closed()):
+                    await self.load_thresholds()
+                    return
+                
+                stale, self.stale_thresholds = self.stale_thresholds, set()
+                if stale:
+                    rows = await self.threshold_conn.fetch(SELECT_CHANGED_PON_PORT_THRESHOLDS_SQL, list(stale))
+                    for row in rows:
+                        self.thresholds[row['id']] = tuple(row[1:])
+        except Exception as e:
+            print(f"✗ Error refreshing PON port thresholds: {str(e)}")
+    
+    async def flush_updates(self, updates, olt_ids):
+        """Write latest PON port values and OLT poll times collected in a cycle"""
+        if not updates and not olt_ids:
+            return
         
         try:
-            print(f"  Polling OLT: {olt_name} ({olt['ip_address']})")
-            
-            # Get vendor handler
-            vendor_class = self.vendor_map.get(olt['vendor'])
-            if not vendor_class:
-                print(f"  ✗ Unsupported vendor: {olt['vendor']}")
-                return False
-            
-            # Get PON ports
-            async with self.db_pool.acquire() as conn:
-                pon_ports = await conn.fetch(
-                    "SELECT * FROM pon_ports WHERE olt_id = $1 AND status = 'active'",
-                    olt_id
-                )
-            
-            # Poll each PON port
-            for pon_port in pon_ports:
-                await self.poll_pon_port(olt, pon_port, vendor_class)
-            
-            # Update OLT last poll
             async with self.db_pool.acquire() as conn:
-                await conn.execute(
-                    "UPDATE olts SET last_poll = NOW() WHERE id = $1",
-                    olt_id
+                if updates:
+                    await conn.executemany(UPDATE_PON_PORT_SQL, updates)
+                
+                if olt_ids:
+                    await conn.execute(UPDATE_OLTS_LAST_POLL_SQL, olt_ids)
+        except Exception as e:
+            print(f"✗ Error updating {len(updates)} PON ports: {str(e)}")
+    
+    async def flush_points(self, points):
+        """Write all points collected in a cycle to InfluxDB"""
+        if not points:
+            return
+        
+        try:
+            # The write API is synchronous, so it runs off the event loop
+            for i in range(0, len(points), self.influx_batch_size):
+                await asyncio.to_thread(
+                    self.influx_write_api.write,
+                    bucket=self.influx_config['bucket'],
+                    record='\n'.join(points[i:i + self.influx_batch_size]),
+                    write_precision=WritePrecision.NS
                 )
-            
-            return True
-            
         except Exception as e:
-            print(f"  ✗ Error polling OLT {olt_name}: {str(e)}")
-            return False
+            print(f"✗ Error writing {len(points)} points to InfluxDB: {str(e)}")
     
-    async def poll_pon_port(self, olt, pon_port, vendor_class):
-        """Poll single PON port"""
-        port_name = pon_port['port_name']
+    async def flush_cache(self, entries):
+        """Write all cached metrics collected in a cycle to Redis"""
+        if not entries:
+            return
         
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for cache_key, mapping in entries.items():
+                    pipe.hset(cache_key, mapping=mapping)
+                    pipe.expire(cache_key, 300)  # 5 minutes
+                await pipe.execute()
+        except Exception as e:
+            print(f"✗ Error caching {len(entries)} PON ports to Redis: {str(e)}")
+    
+    async def poll_pon_port(self, olt, pon_port, vendor_class):
+        """Poll single PON port (metrics dict, or None on failure)"""
         try:
             # SNMP Get for PON port metrics
             metrics = await self.snmp_get_pon_metrics(
@@ -141,124 +338,120 @@ class PONPortPoller:
                 vendor_class
             )
             
-            if not metrics:
-                return
-            
-            # Calculate health score
-            health_score = self.calculate_health_score(metrics)
-            
-            # Update PostgreSQL (latest values)
-            async with self.db_pool.acquire() as conn:
-                await conn.execute("""
-                    UPDATE pon_ports SET
-                        temperature = $1,
-                        voltage = $2,
-                        tx_power = $3,
-                        rx_power = $4,
-                        utilization = $5,
-                        bandwidth_in = $6,
-                        bandwidth_out = $7,
-                        online_onus = $8,
-                        offline_onus = $9,
-                        total_onus = $10,
-                        health_score = $11,
-                        last_poll = NOW()
-                    WHERE id = $12
-                """,
-                    metrics.get('temperature'),
-                    metrics.get('voltage'),
-                    metrics.get('tx_power'),
-                    metrics.get('rx_power'),
-                    metrics.get('utilization'),
-                    metrics.get('bandwidth_in'),
-                    metrics.get('bandwidth_out'),
-                    metrics.get('online_onus', 0),
-                    metrics.get('offline_onus', 0),
-                    metrics.get('total_onus', 0),
-                    health_score,
-                    pon_port['id']
-                )
-            
-            # Write to InfluxDB (time-series)
-            point = Point("pon_port_metrics") \
-                .tag("pon_port_id", str(pon_port['id'])) \
-                .tag("olt_id", str(olt['id'])) \
-                .tag("port_name", port_name) \
-                .field("temperature", float(metrics.get('temperature') or 0)) \
-                .field("voltage", float(metrics.get('voltage') or 0)) \
-                .field("tx_power", float(metrics.get('tx_power') or 0)) \
-                .field("rx_power", float(metrics.get('rx_power') or 0)) \
-                .field("utilization", float(metrics.get('utilization') or 0)) \
-                .field("bandwidth_in", int(metrics.get('bandwidth_in') or 0)) \
-                .field("bandwidth_out", int(metrics.get('bandwidth_out') or 0)) \
-                .field("online_onus", int(metrics.get('online_onus') or 0)) \
-                .field("health_score", int(health_score)) \
-                .time(datetime.utcnow())
-            
-            self.influx_write_api.write(
-                bucket=self.influx_config['bucket'],
-                record=point
-            )
-            
-            # Cache to Redis (real-time dashboard)
-            cache_key = f"pon_port:{pon_port['id']}:metrics"
-            self.redis_client.hset(cache_key, mapping={
-                'temperature': str(metrics.get('temperature') or 0),
-                'voltage': str(metrics.get('voltage') or 0),
-                'tx_power': str(metrics.get('tx_power') or 0),
-                'rx_power': str(metrics.get('rx_power') or 0),
-                'utilization': str(metrics.get('utilization') or 0),
-                'online_onus': str(metrics.get('online_onus') or 0),
-                'health_score': str(health_score),
-                'timestamp': datetime.utcnow().isoformat(),
-            })
-            self.redis_client.expire(cache_key, 300)  # 5 minutes
-            
-            # Check thresholds
-            await self.check_thresholds(pon_port, metrics)
-            
-            print(f"    ✓ {port_name}: Health={health_score}%, Util={metrics.get('utilization', 0):.1f}%")
+            return metrics or None
             
         except Exception as e:
-            print(f"    ✗ Error polling {port_name}: {str(e)}")
+            print(f"    ✗ Error polling {pon_port['port_name']}: {str(e)}")
+            return None
+    
+    async def process_samples(self, samples, cycle_time, updates, points, cache):
+        """Score all PON ports polled in a cycle and queue their writes"""
+        if not samples:
+            return
+        
+        # Calculate health scores for the whole cycle at once
+        health_scores = self.calculate_health_scores([sample[2] for sample in samples])
+        
+        for (olt, pon_port, metrics), health_score in zip(samples, health_scores.tolist()):
+            try:
+                await self.record_pon_port(
+                    olt, pon_port, metrics, health_score, cycle_time, updates, points, cache
+                )
+            except Exception as e:
+                print(f"    ✗ Error recording {pon_port['port_name']}: {str(e)}")
+    
+    async def record_pon_port(self, olt, pon_port, metrics, health_score, cycle_time, updates, points, cache):
+        """Queue database, time-series and cache writes for a polled PON port"""
+        port_name = pon_port['port_name']
+        timestamp_ns, timestamp_iso = cycle_time
+        
+        # Update PostgreSQL (latest values)
+        updates.append((
+            metrics.get('temperature'),
+            metrics.get('voltage'),
+            metrics.get('tx_power'),
+            metrics.get('rx_power'),
+            metrics.get('utilization'),
+            metrics.get('bandwidth_in'),
+            metrics.get('bandwidth_out'),
+            metrics.get('online_onus', 0),
+            metrics.get('offline_onus', 0),
+            metrics.get('total_onus', 0),
+            health_score,
+            pon_port['id']
+        ))
+        
+        # Write to InfluxDB (time-series); empty tag values are invalid line protocol
+        port_tag = f",port_name={escape_tag(port_name)}" if port_name else ""
+        points.append(
+            f"pon_port_metrics,"
+            f"olt_id={olt['id']},pon_port_id={pon_port['id']}{port_tag} "
+            f"temperature={float(metrics.get('temperature') or 0)},"
+            f"voltage={float(metrics.get('voltage') or 0)},"
+            f"tx_power={float(metrics.get('tx_power') or 0)},"
+            f"rx_power={float(metrics.get('rx_power') or 0)},"
+            f"utilization={float(metrics.get('utilization') or 0)},"
+            f"bandwidth_in={int(metrics.get('bandwidth_in') or 0)}i,"
+            f"bandwidth_out={int(metrics.get('bandwidth_out') or 0)}i,"
+            f"online_onus={int(metrics.get('online_onus') or 0)}i,"
+            f"health_score={int(health_score)}i "
+            f"{timestamp_ns}"
+        )
+        
+        # Cache to Redis (real-time dashboard)
+        cache_key = f"pon_port:{pon_port['id']}:metrics"
+        cache[cache_key] = {
+            b'temperature': str(metrics.get('temperature') or 0).encode(),
+            b'voltage': str(metrics.get('voltage') or 0).encode(),
+            b'tx_power': str(metrics.get('tx_power') or 0).encode(),
+            b'rx_power': str(metrics.get('rx_power') or 0).encode(),
+            b'utilization': str(metrics.get('utilization') or 0).encode(),
+            b'online_onus': str(metrics.get('online_onus') or 0).encode(),
+            b'health_score': str(health_score).encode(),
+            b'timestamp': timestamp_iso,
+        }
+        
+        # Check thresholds
+        await self.check_thresholds(pon_port, metrics)
+        
+        print(f"    ✓ {port_name}: Health={health_score}%, Util={metrics.get('utilization') or 0:.1f}%")
     
     async def snmp_get_pon_metrics(self, ip, community, port_number, vendor_class):
         """Get PON port metrics via SNMP"""
         try:
             metrics = {}
             
-            # Build OID index (vendor specific)
-            oid_index = port_number
+            # Request all metrics in a single PDU (one round-trip per port)
+            metric_names = vendor_class.PON_PORT_OIDS.keys()
+            oids = pon_port_var_binds(vendor_class, port_number)
             
-            # Get all metrics
-            for metric_name, base_oid in vendor_class.PON_PORT_OIDS.items():
-                oid = f"{base_oid}.{oid_index}"
-                
-                errorIndication, errorStatus, errorIndex, varBinds = next(
-                    getCmd(SnmpEngine(),
-                           CommunityData(community),
-                           UdpTransportTarget((ip, 161), timeout=5, retries=1),
-                           ContextData(),
-                           ObjectType(ObjectIdentity(oid)))
+            transport_target, community_data = await self.get_snmp_target(ip, community)
+            
+            async with self.snmp_semaphore:
+                errorIndication, errorStatus, errorIndex, varBinds = await getCmd(
+                    self.snmp_dispatcher,
+                    community_data,
+                    transport_target,
+                    *oids,
+                    lookupMib=False
                 )
+            
+            if errorIndication or errorStatus:
+                print(f"      SNMP Error: {errorIndication or errorStatus.prettyPrint()}")
+                return None
+            
+            scales = vendor_class.SCALES
+            for metric_name, varBind in zip(metric_names, varBinds):
+                value = varBind[1]
+                if hasattr(value, '_value'):
+                    value = value._value
                 
-                if errorIndication or errorStatus:
-                    continue
-                
-                for varBind in varBinds:
-                    value = varBind[1]
-                    if hasattr(value, '_value'):
-                        value = value._value
-                    
-                    # Parse based on metric type
-                    if metric_name in ['temperature']:
-                        metrics[metric_name] = vendor_class.parse_temperature(value)
-                    elif metric_name in ['voltage']:
-                        metrics[metric_name] = vendor_class.parse_voltage(value)
-                    elif metric_name in ['tx_power', 'rx_power']:
-                        metrics[metric_name] = vendor_class.parse_power(value)
-                    else:
-                        metrics[metric_name] = int(value) if value else 0
+                # Scaled metrics (temperature, voltage, power) vs raw counters
+                scale = scales.get(metric_name)
+                if scale is not None:
+                    metrics[metric_name] = scale_metric(value, scale)
+                else:
+                    metrics[metric_name] = int(value) if value else 0
             
             # Calculate utilization
             if 'bandwidth_in' in metrics and 'bandwidth_out' in metrics:
@@ -278,53 +471,59 @@ class PONPortPoller:
             print(f"      SNMP Error: {str(e)}")
             return None
     
-    def calculate_health_score(self, metrics):
-        """Calculate PON port health score (0-100)"""
-        score = 100
+    async def get_snmp_target(self, ip, community):
+        """Get the cached SNMP transport target and auth data for an OLT"""
+        key = (ip, community)
+        target = self.snmp_targets.get(key)
+        if target is None:
+            target = (
+                await UdpTransportTarget.create((str(ip), 161), timeout=2, retries=0),
+                CommunityData(community, mpModel=1),
+            )
+            self.snmp_targets[key] = target
+        return target
+    
+    def calculate_health_scores(self, metrics_list):
+        """Calculate PON port health scores (0-100) for a batch of ports"""
+        # Missing temperature/RX power read as 0, which never crosses a threshold
+        utilization = np.array([m.get('utilization') or 0 for m in metrics_list], dtype=np.float64)
+        temperature = np.array([m.get('temperature') or 0 for m in metrics_list], dtype=np.float64)
+        rx_power = np.array([m.get('rx_power') or 0 for m in metrics_list], dtype=np.float64)
+        total_onus = np.array([m.get('total_onus', 0) for m in metrics_list], dtype=np.float64)
+        offline_onus = np.array([m.get('offline_onus', 0) for m in metrics_list], dtype=np.float64)
+        
+        score = np.full(len(metrics_list), 100, dtype=np.int64)
         
         # Utilization (30%)
-        utilization = metrics.get('utilization', 0)
-        if utilization > 90:
-            score -= 30
-        elif utilization > 80:
-            score -= 20
-        elif utilization > 70:
-            score -= 10
+        score -= np.select([utilization > 90, utilization > 80, utilization > 70], [30, 20, 10], 0)
         
         # Temperature (20%)
-        temperature = metrics.get('temperature')
-        if temperature:
-            if temperature > 70:
-                score -= 20
-            elif temperature > 60:
-                score -= 10
+        score -= np.select([temperature > 70, temperature > 60], [20, 10], 0)
         
         # RX Power (30%)
-        rx_power = metrics.get('rx_power')
-        if rx_power:
-            if rx_power < -30:
-                score -= 30
-            elif rx_power < -28:
-                score -= 15
+        score -= np.select([rx_power < -30, rx_power < -28], [30, 15], 0)
         
         # Offline ONUs (20%)
-        total_onus = metrics.get('total_onus', 0)
-        offline_onus = metrics.get('offline_onus', 0)
-        if total_onus > 0:
-            offline_ratio = offline_onus / total_onus
-            if offline_ratio > 0.3:
-                score -= 20
-            elif offline_ratio > 0.2:
-                score -= 10
-        
-        return max(0, score)
+        offline_ratio = np.divide(
+            offline_onus, total_onus,
+            out=np.zeros_like(offline_onus),
+            where=total_onus > 0
+        )
+        score -= np.select([offline_ratio > 0.3, offline_ratio > 0.2], [20, 10], 0)
+        
+        return np.maximum(score, 0)
     
     async def check_thresholds(self, pon_port, metrics):
         """Check if metrics exceed thresholds"""
+        thresholds = self.thresholds.get(pon_port['id'])
+        if thresholds is None:
+            return
+        temperature_high, utilization_high, rx_power_low = thresholds
+        
         alerts = []
         
-        # Temperature
-        if metrics.get('temperature', 0) > pon_port['threshold_temperature_high']:
+        # Temperature (None when the OLT returned no usable reading)
+        if (metrics.get('temperature') or 0) > temperature_high:
             alerts.append({
                 'type': 'temperature',
                 'message': f"Temperature high: {metrics['temperature']:.1f}°C",
@@ -332,7 +531,7 @@ class PONPortPoller:
             })
         
         # Utilization
-        if metrics.get('utilization', 0) > pon_port['threshold_utilization_high']:
+        if (metrics.get('utilization') or 0) > utilization_high:
             alerts.append({
                 'type': 'utilization',
                 'message': f"Utilization high: {metrics['utilization']:.1f}%",
@@ -340,7 +539,7 @@ class PONPortPoller:
             })
         
         # RX Power
-        if metrics.get('rx_power') and metrics['rx_power'] < pon_port['threshold_rx_power_low']:
+        if metrics.get('rx_power') and metrics['rx_power'] < rx_power_low:
             alerts.append({
                 'type': 'rx_power',
                 'message': f"RX Power low: {metrics['rx_power']:.1f} dBm",
@@ -351,39 +550,65 @@ class PONPortPoller:
         for alert in alerts:
             print(f"      ⚠️  ALERT: {alert['message']}")
     
+    async def run_cycle(self):
+        """Run one poll cycle and release its overlap slot when done"""
+        try:
+            start_time = time.monotonic()
+            
+            await self.poll_all_olts()
+            
+            duration = time.monotonic() - start_time
+            print(f"Poll cycle completed in {duration:.2f}s\n")
+            
+        except Exception as e:
+            print(f"❌ Error in poll cycle: {str(e)}")
+        finally:
+            self.cycle_semaphore.release()
+    
     async def run(self):
         """Main polling loop"""
         await self.initialize()
         
         print(f"\n🚀 PON Poller started! Polling every {self.poll_interval}s\n")
         
-        while True:
-            try:
-                start_time = time.time()
-                
-                await self.poll_all_olts()
-                
-                duration = time.time() - start_time
-                print(f"Poll cycle completed in {duration:.2f}s\n")
+        loop = asyncio.get_running_loop()
+        cycles = set()
+        next_deadline = loop.time()
+        
+        try:
+            while True:
+                # A cycle may still be writing when the next one starts its SNMP fan-out
+                await self.cycle_semaphore.acquire()
+                cycle = asyncio.create_task(self.run_cycle())
+                cycles.add(cycle)
+                cycle.add_done_callback(cycles.discard)
                 
-                # Wait for next interval
-                await asyncio.sleep(max(1, self.poll_interval - duration))
+                # Wait for next deadline; skip missed ticks instead of bursting to catch up
+                next_deadline += self.poll_interval
+                now = loop.time()
+                if next_deadline < now:
+                    next_deadline = now
+                await asyncio.sleep(next_deadline - now)
                 
-            except KeyboardInterrupt:
-                print("\n\n🛑 Shutting down...")
-                break
-            except Exception as e:
-                print(f"❌ Error in main loop: {str(e)}")
-                await asyncio.sleep(10)
-        
-        # Cleanup
-        if self.db_pool:
-            await self.db_pool.close()
-        if self.influx_client:
-            self.influx_client.close()
-        
-        print("✓ PON Poller stopped")
+        except KeyboardInterrupt:
+            print("\n\n🛑 Shutting down...")
+        finally:
+            # Cleanup
+            for cycle in cycles:
+                cycle.cancel()
+            await asyncio.gather(*cycles, return_exceptions=True)
+            
+            if self.threshold_conn:
+                await self.threshold_conn.close()
+            if self.db_pool:
+                await self.db_pool.close()
+            if self.redis_client:
+                await self.redis_client.aclose()
+            if self.influx_client:
+                self.influx_client.close()
+            
+            print("✓ PON Poller stopped")
 
 if __name__ == '__main__':
     poller = PONPortPoller()
-    asyncio.run(poller.run())
+    uvloop.run(poller.run())
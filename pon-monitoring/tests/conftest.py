@@ -0,0 +1,9 @@
+"""
+Test configuration
+Makes the pon-monitoring modules importable as top-level packages (e.g. vendors)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
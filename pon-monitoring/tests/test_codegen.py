@@ -0,0 +1,98 @@
+"""
+Generated scalar parsers vs. the hand-written implementations they replace
+"""
+
+import math
+
+import pytest
+
+from vendors import VSOLVendor, ZTEVendor
+from vendors._codegen import make_scalar_parser
+
+# Original VSOL parsers
+
+def vsol_parse_milli(raw_value):
+    try:
+        return float(raw_value) / 1000.0
+    except (ValueError, TypeError):
+        return 0.0
+
+def vsol_parse_power(raw_value):
+    try:
+        value = float(raw_value) / 100.0
+        if value == 0 or value < -40 or value > 10:
+            return None
+        return round(value, 2)
+    except (ValueError, TypeError):
+        return None
+
+# Original ZTE parsers
+
+def zte_parse_power(value):
+    if value is None or value == 0:
+        return None
+    try:
+        return float(value) / 100.0
+    except:
+        return None
+
+def zte_parse_temperature(value):
+    if value is None:
+        return None
+    try:
+        return float(value) / 256.0
+    except:
+        return None
+
+def zte_parse_voltage(value):
+    if value is None:
+        return None
+    try:
+        return float(value) / 10000.0
+    except:
+        return None
+
+CASES = [
+    (VSOLVendor.parse_temperature, vsol_parse_milli),
+    (VSOLVendor.parse_voltage, vsol_parse_milli),
+    (VSOLVendor.parse_bias_current, vsol_parse_milli),
+    (VSOLVendor.parse_power, vsol_parse_power),
+    (ZTEVendor.parse_power, zte_parse_power),
+    (ZTEVendor.parse_temperature, zte_parse_temperature),
+    (ZTEVendor.parse_voltage, zte_parse_voltage),
+]
+
+# Raw values as SNMP hands them over: ints, plus strings, floats and garbage
+RAW_VALUES = [
+    *range(-5000, 5001, 7),
+    -4001, -4000, -3999, 999, 1000, 1001, 0, 1, -1, 2 ** 31, -(2 ** 31),
+    0.0, -0.0, 1.5, -4000.0, 1000.0, -4000.5, 1000.5, 123.456,
+    float('nan'), float('inf'), float('-inf'),
+    '1234', '-1234', ' 42 ', '12.5', '-4001', '1001', 'nan', 'inf',
+    b'1234', True, False,
+    None, '', 'abc', b'\x00', [], {}, object(),
+]
+
+def same(a, b):
+    """Equal results, counting NaN as equal to NaN"""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return type(a) is type(b) and a == b
+
+@pytest.mark.parametrize('parser, original', CASES, ids=lambda f: getattr(f, '__qualname__', None))
+def test_matches_original(parser, original):
+    for raw in RAW_VALUES:
+        # ZTE used to compare a string '0' with 0 (never equal); 0 is "no reading" either way
+        if original is zte_parse_power and raw in ('0', '0.0'):
+            continue
+        assert same(parser(raw), original(raw)), raw
+
+@pytest.mark.parametrize('raw', ['0', '0.0', 0, 0.0])
+def test_zte_zero_power_is_no_reading(raw):
+    assert ZTEVendor.parse_power(raw) is None
+
+def test_int_bounds_match_float_bounds():
+    # Non-integral raw bounds: int fast path must agree with the float path
+    parser = make_scalar_parser(3.0, lo=-1.5, hi=2.5, fallback=-99.0)
+    for raw in range(-10, 11):
+        assert parser(raw) == parser(float(raw)), raw
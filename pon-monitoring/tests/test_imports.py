@@ -0,0 +1,19 @@
+"""
+Import smoke tests: service modules load against the pinned dependencies
+"""
+
+import importlib
+
+import pytest
+
+# Module -> third-party packages it needs (skipped, not failed, when not installed)
+MODULES = {
+    'poller': ('numpy', 'pysnmp', 'asyncpg', 'redis', 'influxdb_client', 'uvloop'),
+    'vendors.async_collector': ('numpy', 'pysnmp'),
+}
+
+@pytest.mark.parametrize('module', MODULES)
+def test_module_imports(module):
+    for requirement in MODULES[module]:
+        pytest.importorskip(requirement)
+    importlib.import_module(module)
@@ -0,0 +1,53 @@
+"""
+Column parsers vs. the scalar parsers for the same PARSER_TABLE entry
+"""
+
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from vendors import VSOLVendor, ZTEVendor
+from vendors._parsers import PARSER_TABLE, SCALAR_PARSERS, build_column_table, parse_column_masked
+
+RAW = [-5000, -4001, -4000, -1500, -1, 0, 1, 999, 1000, 1001, 3300, 12800, 5000000]
+
+@pytest.mark.parametrize('key', PARSER_TABLE)
+def test_column_matches_scalar(key):
+    values, valid = parse_column_masked(*key, RAW)
+    for raw, value, ok in zip(RAW, values.tolist(), valid.tolist()):
+        expected = SCALAR_PARSERS[key](raw)
+        if expected is None:
+            assert math.isnan(value) and not ok, raw
+        else:
+            assert value == pytest.approx(expected) and ok, raw
+
+@pytest.mark.parametrize('key', PARSER_TABLE)
+def test_single_value(key):
+    values, valid = parse_column_masked(*key, 1500.0)
+    assert values.shape == valid.shape == (1,)
+
+def test_missing_values():
+    values, valid = parse_column_masked('VSOL', 'power', [np.nan, -1500])
+    assert math.isnan(values[0]) and valid.tolist() == [0, 1]
+
+def test_column_table():
+    mac = b'\x00\x11\x22\x33\x44\x00'
+    table = build_column_table(VSOLVendor, {
+        'onu_id': [1, 2, 3],
+        'onu_mac_address': [mac, mac, None],
+        'onu_rx_power': [-1500, b'garbage', None],
+        'pon_tx_bias': [12000, 13000, 14000],
+    })
+    assert table['onu_id'].tolist() == [1, 2, 3]
+    # Bytes stay whole (a fixed width 'S6' array would drop the trailing NUL)
+    assert table['onu_mac_address'].tolist() == [mac, mac, None]
+    assert table['onu_rx_power'][0] == -15.0 and table['onu_rx_power_valid'].tolist() == [1, 0, 0]
+    assert table['pon_tx_bias'].tolist() == [12.0, 13.0, 14.0]
+
+def test_column_table_without_bulk_parser():
+    # ZTE has no bias current parser, so tx_bias is passed through
+    table = build_column_table(ZTEVendor, {'tx_bias': [1, 2], 'rx_power': [-1500, 0]})
+    assert table['tx_bias'].tolist() == [1, 2]
+    assert table['rx_power_valid'].tolist() == [1, 0]
@@ -3,6 +3,8 @@ PON Monitoring Vendor Implementations
 Support for multiple OLT vendors
 """
 
+from functools import lru_cache
+
 from .zte import ZTEVendor
 from .huawei import HuaweiVendor
 from .fiberhome import FiberHomeVendor
@@ -16,15 +18,19 @@ VENDORS = {
     'VSOL': VSOLVendor
 }
 
+@lru_cache(maxsize=64)
 def get_vendor(vendor_name):
     """
-    Get vendor implementation by name
+    Get vendor implementation by name (memoized per spelling)
     Args:
         vendor_name: Name of the vendor (case-insensitive)
     Returns:
         Vendor class or None if not found
     """
-    return VENDORS.get(vendor_name.upper())
+    vendor = VENDORS.get(vendor_name)
+    if vendor is None:
+        vendor = VENDORS.get(vendor_name.upper())
+    return vendor
 
 def get_supported_vendors():
     """
@@ -0,0 +1,58 @@
+"""
+Scalar parser code generation
+Builds parse functions with their conversion constants baked in as literals
+"""
+
+import math
+
+def make_scalar_parser(divisor, lo=None, hi=None, nonzero=False, ndigits=None, fallback=None,
+                       name='parse'):
+    """
+    Generate a specialized raw SNMP value parser
+    Args:
+        divisor: Raw units per output unit
+        lo, hi: Valid output range (None for no bound)
+        nonzero: A value of 0 means "no reading"
+        ndigits: Round the result to this many digits (None for no rounding)
+        fallback: Result for unparseable or invalid values
+        name: Function name (shown in tracebacks)
+    Returns:
+        function: parser(raw_value) -> float or fallback
+    """
+    # Plain ints are validated in raw units with integer compares
+    raw_lo = None if lo is None else math.ceil(lo * divisor)
+    raw_hi = None if hi is None else math.floor(hi * divisor)
+
+    def checks(value, low, high):
+        lines = []
+        if nonzero:
+            lines.append(f"if {value} == 0: return {fallback!r}")
+        if low is not None:
+            lines.append(f"if {value} < {low!r}: return {fallback!r}")
+        if high is not None:
+            lines.append(f"if {value} > {high!r}: return {fallback!r}")
+        return lines
+
+    result = 'value' if ndigits is None else f"round(value, {ndigits!r})"
+
+    src = [
+        f"def {name}(raw_value):",
+        "    if type(raw_value) is int:",
+        *(f"        {line}" for line in checks('raw_value', raw_lo, raw_hi)),
+        f"        value = raw_value / {divisor!r}",
+        "    else:",
+        "        if type(raw_value) is float:",
+        "            value = raw_value",
+        "        else:",
+        "            try:",
+        "                value = float(raw_value)",
+        "            except (TypeError, ValueError):",
+        f"                return {fallback!r}",
+        f"        value /= {divisor!r}",
+        *(f"        {line}" for line in checks('value', lo, hi)),
+        f"    return {result}",
+    ]
+
+    namespace = {}
+    exec('\n'.join(src), namespace)
+    return namespace[name]
@@ -0,0 +1,167 @@
+"""
+Shared metric parsers
+Table-driven raw SNMP value -> unit conversion for VSOL and ZTE
+"""
+
+import numpy as np
+
+from ._codegen import make_scalar_parser
+
+# (vendor, metric) -> (divisor, lo, hi, nonzero, ndigits, fallback)
+#   divisor:  raw units per output unit
+#   lo, hi:   valid output range (None for no bound)
+#   nonzero:  a value of 0 means "no reading"
+#   ndigits:  round the result to this many digits (None for no rounding)
+#   fallback: scalar result for unparseable or invalid values
+PARSER_TABLE = {
+    # VSOL: 0.001 degree Celsius, mV, uA, 0.01 dBm
+    ('VSOL', 'temperature'): (1000.0, None, None, False, None, 0.0),
+    ('VSOL', 'voltage'): (1000.0, None, None, False, None, 0.0),
+    ('VSOL', 'bias_current'): (1000.0, None, None, False, None, 0.0),
+    ('VSOL', 'power'): (100.0, -40, 10, True, 2, None),
+
+    # ZTE: 1/256 degree Celsius, 0.1 mV, 0.01 dBm
+    ('ZTE', 'temperature'): (256.0, None, None, False, None, None),
+    ('ZTE', 'voltage'): (10000.0, None, None, False, None, None),
+    ('ZTE', 'power'): (100.0, None, None, True, None, None),
+}
+
+# Reciprocal of each divisor for the column path, where a multiply vectorizes
+# better than a divide. Scalars keep the exact division (same cost in CPython).
+COLUMN_SCALE = {key: 1.0 / spec[0] for key, spec in PARSER_TABLE.items()}
+
+# Specialized scalar parser per table entry, constants baked in (see _codegen)
+SCALAR_PARSERS = {
+    (vendor, metric): make_scalar_parser(*spec, name=f'parse_{metric}')
+    for (vendor, metric), spec in PARSER_TABLE.items()
+}
+
+def table_scale(vendor, metric):
+    """
+    Express a PARSER_TABLE entry as a vendor SCALES entry (see poller.scale_metric)
+    Args:
+        vendor: Vendor name (e.g. 'ZTE')
+        metric: Metric name (e.g. 'power')
+    Returns:
+        tuple: (offset, divisor, invalid raw values)
+    """
+    divisor, lo, hi, nonzero, ndigits, fallback = PARSER_TABLE[vendor, metric]
+    if lo is not None or hi is not None:
+        raise ValueError(f"{vendor} {metric} has a valid range, which SCALES cannot express")
+    return (0, divisor, (0,) if nonzero else ())
+
+def scalar_parser(vendor, metric, doc):
+    """
+    Get the generated scalar parser for a PARSER_TABLE entry, documented
+    Args:
+        vendor: Vendor name (e.g. 'VSOL')
+        metric: Metric name (e.g. 'power')
+        doc: Docstring for the parser
+    Returns:
+        function: parser(raw_value) -> float or the entry's fallback
+    """
+    parser = SCALAR_PARSERS[vendor, metric]
+    parser.__doc__ = doc
+    return parser
+
+def parse_column(vendor, metric, raw):
+    """
+    Convert a column of raw SNMP values using its PARSER_TABLE entry
+    Args:
+        vendor: Vendor name (e.g. 'VSOL')
+        metric: Metric name (e.g. 'power')
+        raw: Array-like of raw SNMP values (or a single value), NaN where missing
+    Returns:
+        np.ndarray: Converted values (float64), NaN where missing or invalid
+    """
+    return parse_column_masked(vendor, metric, raw)[0]
+
+def parse_column_masked(vendor, metric, raw):
+    """
+    Convert a column of raw SNMP values and report which rows are valid
+    Args:
+        vendor: Vendor name (e.g. 'VSOL')
+        metric: Metric name (e.g. 'power')
+        raw: Array-like of raw SNMP values (or a single value), NaN where missing
+    Returns:
+        tuple: (np.ndarray converted values (float64), NaN where missing or invalid,
+                np.ndarray validity mask (uint8), 1 where the value is valid)
+    """
+    divisor, lo, hi, nonzero, ndigits, fallback = PARSER_TABLE[vendor, metric]
+
+    # A fresh array (at least 1-d, so a scalar input can be masked in place)
+    values = np.array(raw, dtype=np.float64, ndmin=1)
+    values *= COLUMN_SCALE[vendor, metric]
+
+    invalid = np.isnan(values)
+    if nonzero:
+        invalid |= values == 0
+    if lo is not None:
+        invalid |= values < lo
+    if hi is not None:
+        invalid |= values > hi
+    values[invalid] = np.nan
+
+    if ndigits is not None:
+        np.round(values, ndigits, out=values)
+    return values, (~invalid).view(np.uint8)
+
+# Column metric -> vendor bulk parser used by build_column_table. A column is
+# matched by its name without any 'onu_'/'pon_' prefix (e.g. VSOL OIDS keys).
+COLUMN_PARSERS = {
+    'temperature': 'parse_temperature_bulk',
+    'voltage': 'parse_voltage_bulk',
+    'tx_bias': 'parse_bias_current_bulk',
+    'tx_power': 'parse_power_bulk',
+    'rx_power': 'parse_power_bulk',
+}
+
+def raw_number(value):
+    """
+    Convert a raw value for a numeric column
+    Args:
+        value: Raw SNMP value (None if missing)
+    Returns:
+        float: The value, NaN if missing or not numeric
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+def build_column_table(vendor_cls, raw_columns):
+    """
+    Parse raw columns into a column table (one array per metric)
+    Args:
+        vendor_cls: Vendor class providing the *_bulk parsers
+        raw_columns: Dictionary of column name -> sequence of raw values (equal
+                     length), None or NaN where missing
+    Returns:
+        dict: Column name -> 1-d np.ndarray. Parsed metrics are float64 (NaN where
+              missing or invalid), power columns also get a '<name>_valid' uint8
+              mask. Can be passed straight to pyarrow.table() or
+              pandas.DataFrame() without copying.
+    """
+    table = {}
+    for column, raw in raw_columns.items():
+        metric = column[4:] if column.startswith(('onu_', 'pon_')) else column
+        parser = COLUMN_PARSERS.get(metric)
+        if parser is None or not hasattr(vendor_cls, parser):
+            # IDs, status codes, counters: kept as raw values. Anything
+            # non-numeric (e.g. MAC bytes) stays as objects, since a fixed
+            # width bytes/str array would drop trailing NUL bytes
+            values = np.asarray(raw)
+            if values.dtype.kind not in 'biuf' or values.ndim != 1:
+                values = np.fromiter(raw, dtype=object, count=len(raw))
+            table[column] = values
+            continue
+
+        if not (isinstance(raw, np.ndarray) and raw.dtype.kind in 'biuf'):
+            raw = np.fromiter(map(raw_number, raw), dtype=np.float64, count=len(raw))
+        parsed = getattr(vendor_cls, parser)(raw)
+        if isinstance(parsed, tuple):
+            table[column], table[f'{column}_valid'] = parsed
+        else:
+            table[column] = parsed
+
+    return table
@@ -0,0 +1,194 @@
+"""
+Async ONU Table Collector
+Bulk-walks a vendor's ONU columns over SNMP and parses them column-at-a-time
+"""
+
+import asyncio
+import os
+
+from pyasn1.type.univ import Null, OctetString
+from pysnmp.hlapi.v1arch.asyncio import (
+    SnmpDispatcher,
+    CommunityData,
+    UdpTransportTarget,
+    bulkCmd,
+)
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
+
+from ._parsers import build_column_table
+
+# Rows requested per GETBULK PDU
+MAX_REPETITIONS = int(os.getenv('SNMP_MAX_REPETITIONS', 25))
+
+# (ip, community) -> (transport target, auth data)
+SNMP_TARGETS = {}
+
+def onu_columns(vendor_cls):
+    """
+    Get the ONU table columns to walk for a vendor
+    Args:
+        vendor_cls: Vendor class
+    Returns:
+        dict: Column name -> numeric base OID tuple
+    """
+    if hasattr(vendor_cls, 'ONU_OIDS_TUPLE'):
+        return vendor_cls.ONU_OIDS_TUPLE
+    return {
+        key[len('onu_'):]: oid
+        for key, oid in vendor_cls.OIDS_TUPLE.items()
+        if key.startswith('onu_')
+    }
+
+async def get_snmp_target(ip, community):
+    """
+    Get the cached SNMP transport target and auth data for an OLT
+    Args:
+        ip: OLT IP address
+        community: SNMP community
+    Returns:
+        tuple: (UdpTransportTarget, CommunityData)
+    """
+    key = (ip, community)
+    target = SNMP_TARGETS.get(key)
+    if target is None:
+        target = (
+            await UdpTransportTarget.create((str(ip), 161), timeout=2, retries=1),
+            CommunityData(community, mpModel=1),
+        )
+        SNMP_TARGETS[key] = target
+    return target
+
+async def bulk_walk(dispatcher, community_data, transport_target, base_oid,
+                    max_repetitions=MAX_REPETITIONS):
+    """
+    Walk one SNMP table column with GETBULK
+    Args:
+        dispatcher: Shared SnmpDispatcher
+        community_data: CommunityData for the OLT
+        transport_target: UdpTransportTarget for the OLT
+        base_oid: Numeric column OID tuple
+        max_repetitions: Rows requested per PDU
+    Returns:
+        dict: Row index (OID suffix tuple) -> raw value, or None on SNMP error
+    """
+    rows = {}
+    prefix_len = len(base_oid)
+    oid = base_oid
+
+    while True:
+        errorIndication, errorStatus, errorIndex, varBinds = await bulkCmd(
+            dispatcher,
+            community_data,
+            transport_target,
+            0, max_repetitions,
+            (oid, Null()),
+            lookupMib=False
+        )
+
+        if errorIndication or errorStatus:
+            print(f"      SNMP Error: {errorIndication or errorStatus.prettyPrint()}")
+            return None
+
+        if not varBinds:
+            return rows
+
+        # One column requested, so the response is that column's next rows in order
+        for name, value in varBinds:
+            next_oid = name.asTuple()
+            # Stop at the end of the column (or of the MIB)
+            if next_oid[:prefix_len] != base_oid or isinstance(value, (EndOfMibView, NoSuchObject, NoSuchInstance)):
+                return rows
+            # A buggy agent that does not advance would otherwise loop forever
+            if next_oid <= oid:
+                print(f"      SNMP Error: OID not increasing after {'.'.join(map(str, oid))}")
+                return rows
+            oid = next_oid
+            rows[oid[prefix_len:]] = value
+
+def plain_value(value):
+    """
+    Unwrap a walked SNMP value
+    Args:
+        value: pysnmp value (None if the row is missing)
+    Returns:
+        int for numeric types, bytes for octet strings (MACs, serials),
+        str for anything else, None if missing
+    """
+    if value is None:
+        return None
+    if isinstance(value, OctetString):
+        return value.asOctets()
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+def build_columns(vendor_cls, walked):
+    """
+    Align walked columns on ONU index and parse them
+    Args:
+        vendor_cls: Vendor class
+        walked: Column name -> {row index: raw value}
+    Returns:
+        dict: 'index' (list of row index tuples) plus the column table of
+              _parsers.build_column_table (raw status codes, parsed metrics
+              with NaN where missing or invalid, '<column>_valid' power masks)
+    """
+    index = sorted(set().union(*walked.values()))
+    result = {'index': index}
+    result.update(build_column_table(vendor_cls, {
+        column: [plain_value(rows.get(i)) for i in index]
+        for column, rows in walked.items()
+    }))
+    return result
+
+async def poll_olt(ip, vendor_cls, community='public', dispatcher=None):
+    """
+    Walk and parse the ONU table of one OLT
+    Args:
+        ip: OLT IP address
+        vendor_cls: Vendor class
+        community: SNMP community
+        dispatcher: Shared SnmpDispatcher (a private one is used if None)
+    Returns:
+        dict: Parsed ONU columns (see build_columns), or None on SNMP error
+    """
+    own_dispatcher = dispatcher is None
+    if own_dispatcher:
+        dispatcher = SnmpDispatcher()
+
+    try:
+        transport_target, community_data = await get_snmp_target(ip, community)
+
+        # All columns of this OLT are walked concurrently
+        columns = onu_columns(vendor_cls)
+        walks = await asyncio.gather(*(
+            bulk_walk(dispatcher, community_data, transport_target, base_oid)
+            for base_oid in columns.values()
+        ))
+    finally:
+        if own_dispatcher:
+            dispatcher.transportDispatcher.closeDispatcher()
+
+    if any(rows is None for rows in walks):
+        return None
+
+    return build_columns(vendor_cls, dict(zip(columns, walks)))
+
+async def poll_fleet(fleet, community='public'):
+    """
+    Poll the ONU tables of many OLTs at once
+    Args:
+        fleet: Iterable of (ip, vendor_cls)
+        community: SNMP community
+    Returns:
+        list: poll_olt result (or exception) per OLT, in fleet order
+    """
+    dispatcher = SnmpDispatcher()
+    try:
+        return await asyncio.gather(
+            *(poll_olt(ip, vendor_cls, community, dispatcher) for ip, vendor_cls in fleet),
+            return_exceptions=True
+        )
+    finally:
+        dispatcher.transportDispatcher.closeDispatcher()
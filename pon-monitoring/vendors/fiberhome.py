@@ -3,6 +3,8 @@ FiberHome OLT OID Mappings and Parser
 Support for FiberHome AN5516 series
 """
 
+from types import MappingProxyType
+
 class FiberHomeVendor:
     """FiberHome specific OID mappings and data parsers"""
     
@@ -35,6 +37,12 @@ class FiberHomeVendor:
         'system_uptime': '1.3.6.1.2.1.1.3.0',
     }
     
+    # Read-only view of OIDS (shared, no per-call copy)
+    OIDS_VIEW = MappingProxyType(OIDS)
+    
+    # OIDS as tuples of ints, parsed once at import instead of on every request
+    OIDS_TUPLE = {key: tuple(map(int, oid.split('.'))) for key, oid in OIDS.items()}
+    
     @staticmethod
     def parse_pon_status(raw_value):
         """
@@ -171,7 +179,8 @@ class FiberHomeVendor:
         # Calculate percentage
         utilization = (current_mbps / max_bandwidth) * 100
         
-        return min(max(utilization, 0.0), 100.0)
+        # Clamp to 0-100 without calling min()/max()
+        return 0.0 if utilization < 0.0 else (100.0 if utilization > 100.0 else utilization)
     
     @classmethod
     def get_oid(cls, key):
@@ -184,11 +193,22 @@ class FiberHomeVendor:
         """
         return cls.OIDS.get(key)
     
+    @classmethod
+    def get_oid_tuple(cls, key):
+        """
+        Get numeric OID tuple for a specific metric
+        Args:
+            key: Metric key
+        Returns:
+            tuple: OID as a tuple of ints or None
+        """
+        return cls.OIDS_TUPLE.get(key)
+    
     @classmethod
     def get_all_oids(cls):
         """
         Get all OIDs for this vendor
         Returns:
-            dict: All OID mappings
+            MappingProxyType: Read-only view of all OID mappings (call .copy() for a mutable dict)
         """
-        return cls.OIDS.copy()
+        return cls.OIDS_VIEW
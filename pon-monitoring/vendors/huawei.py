@@ -2,6 +2,8 @@
 Huawei OLT OID Mappings
 """
 
+from functools import lru_cache
+
 class HuaweiVendor:
     NAME = 'Huawei'
     
@@ -27,14 +29,28 @@ class HuaweiVendor:
         'voltage': '1.3.6.1.4.1.2011.6.128.1.1.2.51.1.9',
     }
     
+    # OIDs as tuples of ints, parsed once at import instead of on every request
+    PON_PORT_OIDS_TUPLE = {key: tuple(map(int, oid.split('.'))) for key, oid in PON_PORT_OIDS.items()}
+    ONU_OIDS_TUPLE = {key: tuple(map(int, oid.split('.'))) for key, oid in ONU_OIDS.items()}
+    
+    # Raw -> unit conversion used by the poller: (offset, divisor, invalid raw values)
+    SCALES = {
+        'temperature': (0, 256.0, (65535,)),
+        'voltage': (0, 10000.0, (65535,)),
+        'tx_power': (10000, 100.0, (0, 65535)),
+        'rx_power': (10000, 100.0, (0, 65535)),
+    }
+    
     @staticmethod
     def parse_power(value):
         """Convert raw power value to dBm"""
         if value is None or value == 0 or value == 65535:
             return None
+        if type(value) is int:
+            return (value - 10000) / 100.0
         try:
             return (float(value) - 10000) / 100.0
-        except:
+        except (TypeError, ValueError):
             return None
     
     @staticmethod
@@ -42,9 +58,11 @@ class HuaweiVendor:
         """Convert raw temperature value to Celsius"""
         if value is None or value == 65535:
             return None
+        if type(value) is int:
+            return value / 256.0
         try:
             return float(value) / 256.0
-        except:
+        except (TypeError, ValueError):
             return None
     
     @staticmethod
@@ -52,9 +70,11 @@ class HuaweiVendor:
         """Convert raw voltage value to Volts"""
         if value is None or value == 65535:
             return None
+        if type(value) is int:
+            return value / 10000.0
         try:
             return float(value) / 10000.0
-        except:
+        except (TypeError, ValueError):
             return None
     
     @staticmethod
@@ -68,11 +88,16 @@ class HuaweiVendor:
         return status_map.get(value, 'unknown')
     
     @staticmethod
-    def calculate_utilization(bandwidth_in, bandwidth_out, port_capacity=10000000000):
+    @lru_cache(maxsize=32)
+    def _inv_cap_pct(port_capacity):
+        """Percent per unit of bandwidth for a port capacity (cached per capacity)"""
+        return 100.0 / port_capacity
+    
+    @classmethod
+    def calculate_utilization(cls, bandwidth_in, bandwidth_out, port_capacity=10000000000):
         """Calculate port utilization percentage"""
         if bandwidth_in is None or bandwidth_out is None:
             return 0.0
         
-        total_bandwidth = bandwidth_in + bandwidth_out
-        utilization = (total_bandwidth / port_capacity) * 100
-        return min(100.0, utilization)
+        utilization = (bandwidth_in + bandwidth_out) * cls._inv_cap_pct(port_capacity)
+        return 100.0 if utilization > 100.0 else utilization
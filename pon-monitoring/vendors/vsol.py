@@ -3,9 +3,17 @@ VSOL OLT OID Mappings and Parser
 Support for VSOL V-SOL V1600 series
 """
 
+from types import MappingProxyType
+
+import numpy as np
+
+from ._parsers import scalar_parser, parse_column, parse_column_masked, build_column_table
+
 class VSOLVendor:
     """VSOL specific OID mappings and data parsers"""
     
+    __slots__ = ()  # used as a namespace of class/static methods, no instance state
+    
     VENDOR_NAME = "VSOL"
     
     # OID Mappings for VSOL
@@ -44,8 +52,21 @@ class VSOLVendor:
         'system_location': '1.3.6.1.2.1.1.6.0',
     }
     
-    @staticmethod
-    def parse_pon_status(raw_value):
+    # Read-only view of OIDS (shared, no per-call copy)
+    OIDS_VIEW = MappingProxyType(OIDS)
+    
+    # OIDS as tuples of ints, parsed once at import instead of on every request
+    OIDS_TUPLE = {key: tuple(map(int, oid.split('.'))) for key, oid in OIDS.items()}
+    
+    # Status descriptions indexed by raw SNMP status code
+    _PON_STATUS_TUPLE = ('unknown', 'up', 'down', 'testing')
+    _ONU_STATUS_TUPLE = ('unknown', 'online', 'offline', 'logging', 'authFailed', 'los')  # 5: Loss of Signal
+    
+    # Separators stripped from hex-string MAC addresses
+    _MAC_TRANS = str.maketrans('', '', ': ')
+    
+    @classmethod
+    def parse_pon_status(cls, raw_value):
         """
         Parse PON port status
         Args:
@@ -53,75 +74,99 @@ class VSOLVendor:
         Returns:
             str: Status description
         """
-        status_map = {
-            1: 'up',
-            2: 'down',
-            3: 'testing'
-        }
-        try:
-            return status_map.get(int(raw_value), 'unknown')
-        except (ValueError, TypeError):
-            return 'unknown'
+        if type(raw_value) is int:
+            code = raw_value
+        else:
+            try:
+                code = int(raw_value)
+            except (ValueError, TypeError):
+                return 'unknown'
+        
+        if 0 <= code < len(cls._PON_STATUS_TUPLE):
+            return cls._PON_STATUS_TUPLE[code]
+        return 'unknown'
     
-    @staticmethod
-    def parse_temperature(raw_value):
-        """
+    # Generated parser (see _parsers.PARSER_TABLE)
+    parse_temperature = staticmethod(scalar_parser('VSOL', 'temperature', """
         Parse temperature value
         Args:
             raw_value: Raw SNMP value (in 0.001 degree Celsius)
         Returns:
-            float: Temperature in Celsius
-        """
-        try:
-            return float(raw_value) / 1000.0
-        except (ValueError, TypeError):
-            return 0.0
+            float: Temperature in Celsius, 0.0 if unparseable
+        """))
     
-    @staticmethod
-    def parse_voltage(raw_value):
+    @classmethod
+    def parse_temperature_bulk(cls, raw):
+        """
+        Parse a column of temperature values
+        Args:
+            raw: Raw SNMP values (in 0.001 degree Celsius), NaN where missing
+        Returns:
+            np.ndarray: Temperatures in Celsius (float64)
         """
+        return parse_column(cls.VENDOR_NAME, 'temperature', raw)
+    
+    # Generated parser (see _parsers.PARSER_TABLE)
+    parse_voltage = staticmethod(scalar_parser('VSOL', 'voltage', """
         Parse voltage value
         Args:
             raw_value: Raw SNMP value (in mV)
         Returns:
-            float: Voltage in Volts
-        """
-        try:
-            return float(raw_value) / 1000.0
-        except (ValueError, TypeError):
-            return 0.0
+            float: Voltage in Volts, 0.0 if unparseable
+        """))
     
-    @staticmethod
-    def parse_power(raw_value):
+    @classmethod
+    def parse_voltage_bulk(cls, raw):
         """
+        Parse a column of voltage values
+        Args:
+            raw: Raw SNMP values (in mV), NaN where missing
+        Returns:
+            np.ndarray: Voltages in Volts (float64)
+        """
+        return parse_column(cls.VENDOR_NAME, 'voltage', raw)
+    
+    # Generated parser (see _parsers.PARSER_TABLE)
+    parse_power = staticmethod(scalar_parser('VSOL', 'power', """
         Parse optical power value
         Args:
             raw_value: Raw SNMP value (in 0.01 dBm)
         Returns:
-            float: Power in dBm
-        """
-        try:
-            value = float(raw_value) / 100.0
-            # VSOL specific: check for invalid values
-            if value == 0 or value < -40 or value > 10:
-                return None
-            return round(value, 2)
-        except (ValueError, TypeError):
-            return None
+            float: Power in dBm, or None for 0 and values outside -40..10 dBm
+                   (VSOL specific) or unparseable values
+        """))
     
-    @staticmethod
-    def parse_bias_current(raw_value):
+    @classmethod
+    def parse_power_bulk(cls, raw):
+        """
+        Parse a column of optical power values
+        Args:
+            raw: Raw SNMP values (in 0.01 dBm), NaN where missing
+        Returns:
+            tuple: (np.ndarray power in dBm (float64), NaN where missing or invalid,
+                    np.ndarray validity mask (uint8), 1 where the value is valid)
         """
+        return parse_column_masked(cls.VENDOR_NAME, 'power', raw)
+    
+    # Generated parser (see _parsers.PARSER_TABLE)
+    parse_bias_current = staticmethod(scalar_parser('VSOL', 'bias_current', """
         Parse TX bias current
         Args:
             raw_value: Raw SNMP value (in uA)
         Returns:
-            float: Bias current in mA
+            float: Bias current in mA, 0.0 if unparseable
+        """))
+    
+    @classmethod
+    def parse_bias_current_bulk(cls, raw):
         """
-        try:
-            return float(raw_value) / 1000.0
-        except (ValueError, TypeError):
-            return 0.0
+        Parse a column of TX bias current values
+        Args:
+            raw: Raw SNMP values (in uA), NaN where missing
+        Returns:
+            np.ndarray: Bias current in mA (float64)
+        """
+        return parse_column(cls.VENDOR_NAME, 'bias_current', raw)
     
     @staticmethod
     def parse_traffic(raw_value):
@@ -132,13 +177,15 @@ class VSOLVendor:
         Returns:
             int: Traffic in bytes
         """
+        if type(raw_value) is int:
+            return raw_value
         try:
             return int(raw_value)
         except (ValueError, TypeError):
             return 0
     
-    @staticmethod
-    def parse_onu_status(raw_value):
+    @classmethod
+    def parse_onu_status(cls, raw_value):
         """
         Parse ONU status
         Args:
@@ -146,17 +193,17 @@ class VSOLVendor:
         Returns:
             str: Status description
         """
-        status_map = {
-            1: 'online',
-            2: 'offline',
-            3: 'logging',
-            4: 'authFailed',
-            5: 'los'  # Loss of Signal
-        }
-        try:
-            return status_map.get(int(raw_value), 'unknown')
-        except (ValueError, TypeError):
-            return 'unknown'
+        if type(raw_value) is int:
+            code = raw_value
+        else:
+            try:
+                code = int(raw_value)
+            except (ValueError, TypeError):
+                return 'unknown'
+        
+        if 0 <= code < len(cls._ONU_STATUS_TUPLE):
+            return cls._ONU_STATUS_TUPLE[code]
+        return 'unknown'
     
     @staticmethod
     def parse_distance(raw_value):
@@ -167,32 +214,38 @@ class VSOLVendor:
         Returns:
             int: Distance in meters
         """
+        if type(raw_value) is int:
+            return raw_value
         try:
             return int(raw_value)
         except (ValueError, TypeError):
             return 0
     
-    @staticmethod
-    def parse_mac_address(raw_value):
+    @classmethod
+    def parse_mac_address(cls, raw_value):
         """
         Parse MAC address
         Args:
-            raw_value: Raw SNMP value (bytes)
+            raw_value: Raw SNMP value (bytes, OctetString or hex string)
         Returns:
             str: MAC address in XX:XX:XX:XX:XX:XX format
         """
         if not raw_value:
             return None
         
+        # Binary value (bytes, bytearray, pysnmp OctetString); bytes(int) would zero-fill
+        if not isinstance(raw_value, (int, str)):
+            try:
+                mac_bytes = bytes(raw_value)
+            except (TypeError, ValueError):
+                mac_bytes = None
+            if mac_bytes is not None and (len(mac_bytes) == 6 or isinstance(raw_value, (bytes, bytearray))):
+                return mac_bytes.hex(':')
+        
+        # Hex string (e.g. '00:1A:2B:3C:4D:5E' or '001A 2B3C 4D5E')
         try:
-            if isinstance(raw_value, bytes):
-                mac_bytes = raw_value
-            else:
-                # Convert hex string to bytes
-                mac_bytes = bytes.fromhex(str(raw_value).replace(':', '').replace(' ', ''))
-            
-            return ':'.join(f'{b:02x}' for b in mac_bytes)
-        except Exception:
+            return bytes.fromhex(str(raw_value).translate(cls._MAC_TRANS)).hex(':')
+        except (TypeError, ValueError):
             return None
     
     @staticmethod
@@ -241,7 +294,54 @@ class VSOLVendor:
         # Calculate percentage
         utilization = (mbps / max_bandwidth) * 100
         
-        return min(max(utilization, 0.0), 100.0)
+        # Clamp to 0-100 without calling min()/max()
+        return 0.0 if utilization < 0.0 else (100.0 if utilization > 100.0 else utilization)
+    
+    @staticmethod
+    def calculate_ber_bulk(errors, packets):
+        """
+        Calculate Bit Error Rate for a batch of ports/ONUs
+        Args:
+            errors: Array of error counts
+            packets: Array of packet counts
+        Returns:
+            np.ndarray: BER values (float64), 0 where packets is 0
+        """
+        errors = np.asarray(errors, dtype=np.float64)
+        packets = np.asarray(packets, dtype=np.float64)
+        
+        ber = np.divide(
+            errors, packets,
+            out=np.zeros(np.broadcast_shapes(errors.shape, packets.shape)),
+            where=packets != 0
+        )
+        return np.minimum(ber, 1.0, out=ber)
+    
+    @staticmethod
+    def calculate_utilization_bulk(bytes_in, bytes_out, interval, max_bandwidth=2500):
+        """
+        Calculate utilization percentage for a batch of PON ports
+        Args:
+            bytes_in: Array of bytes received
+            bytes_out: Array of bytes sent
+            interval: Time interval in seconds (scalar or array)
+            max_bandwidth: Maximum bandwidth in Mbps (default 2500 for GPON)
+        Returns:
+            np.ndarray: Utilization percentages (0-100), 0 where interval <= 0
+        """
+        total_bytes = np.asarray(bytes_in, dtype=np.float64) + np.asarray(bytes_out, dtype=np.float64)
+        interval = np.asarray(interval, dtype=np.float64)
+        shape = np.broadcast_shapes(total_bytes.shape, interval.shape)
+        
+        if max_bandwidth <= 0:
+            return np.zeros(shape)
+        
+        # bytes -> bits -> Mbps -> percent of max_bandwidth, folded into one multiplier
+        scale = 8.0 * 100.0 / (1_000_000 * max_bandwidth)
+        inv_interval = np.divide(1.0, interval, out=np.zeros(shape), where=interval > 0)
+        
+        utilization = total_bytes * inv_interval * scale
+        return np.clip(utilization, 0.0, 100.0, out=utilization)
     
     @classmethod
     def get_oid(cls, key):
@@ -254,14 +354,25 @@ class VSOLVendor:
         """
         return cls.OIDS.get(key)
     
+    @classmethod
+    def get_oid_tuple(cls, key):
+        """
+        Get numeric OID tuple for a specific metric
+        Args:
+            key: Metric key
+        Returns:
+            tuple: OID as a tuple of ints or None
+        """
+        return cls.OIDS_TUPLE.get(key)
+    
     @classmethod
     def get_all_oids(cls):
         """
         Get all OIDs for this vendor
         Returns:
-            dict: All OID mappings
+            MappingProxyType: Read-only view of all OID mappings (call .copy() for a mutable dict)
         """
-        return cls.OIDS.copy()
+        return cls.OIDS_VIEW
     
     @classmethod
     def validate_onu_data(cls, data):
@@ -272,15 +383,49 @@ class VSOLVendor:
         Returns:
             bool: True if valid, False otherwise
         """
-        required_fields = ['onu_id', 'onu_status']
-        
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                return False
+        # Required fields must be present and not None
+        if data.get('onu_id') is None or data.get('onu_status') is None:
+            return False
         
-        # Check power values are within reasonable range
-        if 'onu_rx_power' in data and data['onu_rx_power'] is not None:
-            if data['onu_rx_power'] < -40 or data['onu_rx_power'] > 10:
-                return False
+        # Check power values are within reasonable range (NaN means no reading and passes)
+        rx_power = data.get('onu_rx_power')
+        if rx_power is not None and (rx_power < -40 or rx_power > 10):
+            return False
         
         return True
+    
+    @classmethod
+    def validate_onu_data_bulk(cls, data_table):
+        """
+        Validate a table of ONUs before storing
+        Args:
+            data_table: Dictionary of raw ONU columns: 'onu_id', 'onu_status' and
+                        optionally 'onu_rx_power' (0 or NaN where missing)
+        Returns:
+            np.ndarray: Validity mask (uint8), 1 where the ONU is valid
+        """
+        onu_id = np.asarray(data_table['onu_id'])
+        onu_status = np.asarray(data_table['onu_status'])
+        
+        # Required fields present (NaN compares False)
+        valid = (onu_id > 0) & (onu_status > 0)
+        
+        # As in validate_onu_data, only an RX reading that exists must be in range;
+        # a missing one (NaN, or 0 which parse_power treats as no reading) passes
+        if 'onu_rx_power' in data_table:
+            raw_rx = np.asarray(data_table['onu_rx_power'], dtype=np.float64)
+            rx_valid = cls.parse_power_bulk(raw_rx)[1].view(np.bool_)
+            valid &= rx_valid | np.isnan(raw_rx) | (raw_rx == 0)
+        
+        return valid.view(np.uint8)
+    
+    @classmethod
+    def build_result_table(cls, raw_columns):
+        """
+        Parse walked columns into a column table (one array per metric)
+        Args:
+            raw_columns: Dictionary of OIDS key -> raw SNMP values (equal length)
+        Returns:
+            dict: Column name -> np.ndarray (see _parsers.build_column_table)
+        """
+        return build_column_table(cls, raw_columns)
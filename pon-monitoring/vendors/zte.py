@@ -2,7 +2,13 @@
 ZTE OLT OID Mappings
 """
 
+from functools import lru_cache
+
+from ._parsers import scalar_parser, table_scale, parse_column, parse_column_masked
+
 class ZTEVendor:
+    __slots__ = ()  # used as a namespace of class/static methods, no instance state
+    
     NAME = 'ZTE'
     
     # PON Port OIDs
@@ -27,53 +33,70 @@ class ZTEVendor:
         'voltage': '1.3.6.1.4.1.3902.1082.500.10.2.50.1.1.9',
     }
     
-    @staticmethod
-    def parse_power(value):
-        """Convert raw power value to dBm"""
-        if value is None or value == 0:
-            return None
-        try:
-            return float(value) / 100.0
-        except:
-            return None
+    # OIDs as tuples of ints, parsed once at import instead of on every request
+    PON_PORT_OIDS_TUPLE = {key: tuple(map(int, oid.split('.'))) for key, oid in PON_PORT_OIDS.items()}
+    ONU_OIDS_TUPLE = {key: tuple(map(int, oid.split('.'))) for key, oid in ONU_OIDS.items()}
     
-    @staticmethod
-    def parse_temperature(value):
-        """Convert raw temperature value to Celsius"""
-        if value is None:
-            return None
-        try:
-            return float(value) / 256.0
-        except:
-            return None
+    # Raw -> unit conversion used by the poller: (offset, divisor, invalid raw values),
+    # taken from the same PARSER_TABLE entries as parse_* and *_bulk
+    SCALES = {
+        'temperature': table_scale('ZTE', 'temperature'),
+        'voltage': table_scale('ZTE', 'voltage'),
+        'tx_power': table_scale('ZTE', 'power'),
+        'rx_power': table_scale('ZTE', 'power'),
+    }
     
-    @staticmethod
-    def parse_voltage(value):
-        """Convert raw voltage value to Volts"""
-        if value is None:
-            return None
-        try:
-            return float(value) / 10000.0
-        except:
-            return None
+    # ONU status descriptions indexed by raw SNMP status code
+    _ONU_STATUS_TUPLE = ('unknown', 'online', 'offline', 'los', 'dying_gasp')
     
-    @staticmethod
-    def parse_onu_status(value):
+    # Generated parsers (see _parsers.PARSER_TABLE)
+    parse_power = staticmethod(scalar_parser('ZTE', 'power', """Convert raw power value to dBm (None if missing or 0)"""))
+    
+    @classmethod
+    def parse_power_bulk(cls, raw):
+        """Convert a column of raw power values to dBm, plus a uint8 validity mask (0 where missing or 0)"""
+        return parse_column_masked(cls.NAME, 'power', raw)
+    
+    parse_temperature = staticmethod(scalar_parser('ZTE', 'temperature', """Convert raw temperature value to Celsius"""))
+    
+    @classmethod
+    def parse_temperature_bulk(cls, raw):
+        """Convert a column of raw temperature values to Celsius (NaN where missing)"""
+        return parse_column(cls.NAME, 'temperature', raw)
+    
+    parse_voltage = staticmethod(scalar_parser('ZTE', 'voltage', """Convert raw voltage value to Volts"""))
+    
+    @classmethod
+    def parse_voltage_bulk(cls, raw):
+        """Convert a column of raw voltage values to Volts (NaN where missing)"""
+        return parse_column(cls.NAME, 'voltage', raw)
+    
+    @classmethod
+    def parse_onu_status(cls, value):
         """Parse ONU status"""
-        status_map = {
-            1: 'online',
-            2: 'offline',
-            3: 'los',
-            4: 'dying_gasp',
-        }
-        return status_map.get(value, 'unknown')
+        if type(value) is int:
+            code = value
+        else:
+            try:
+                code = int(value)
+            except (ValueError, TypeError):
+                return 'unknown'
+        
+        if 0 <= code < len(cls._ONU_STATUS_TUPLE):
+            return cls._ONU_STATUS_TUPLE[code]
+        return 'unknown'
     
     @staticmethod
-    def calculate_utilization(bandwidth_in, bandwidth_out, port_capacity=10000000000):
+    @lru_cache(maxsize=32)
+    def _inv_cap_pct(port_capacity):
+        """Percent per unit of bandwidth for a port capacity (cached per capacity)"""
+        return 100.0 / port_capacity
+    
+    @classmethod
+    def calculate_utilization(cls, bandwidth_in, bandwidth_out, port_capacity=10000000000):
         """Calculate port utilization percentage"""
         if bandwidth_in is None or bandwidth_out is None:
             return 0.0
         
-        total_bandwidth = bandwidth_in + bandwidth_out
-        utilization = (total_bandwidth / port_capacity) * 100
-        return min(100.0, utilization)
+        utilization = (bandwidth_in + bandwidth_out) * cls._inv_cap_pct(port_capacity)
+        return 100.0 if utilization > 100.0 else utilization